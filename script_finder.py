@@ -3,24 +3,34 @@
 Script Finder - A tool to find and download PDF movie/TV scripts from websites.
 """
 
+import functools
 import os
 import re
+import shutil
 import sys
+import threading
+import time
 import warnings
-from urllib.parse import urljoin, urlparse, unquote
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import parse_qsl, unquote, urldefrag, urlencode, urljoin, urlparse, urlunparse
 
+import lxml.html
+from lxml import etree
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Try to import playwright for JS-rendered pages
 try:
     from playwright.sync_api import sync_playwright
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     sync_playwright = None  # type: ignore
+    PlaywrightTimeoutError = None  # type: ignore
     PLAYWRIGHT_AVAILABLE = False
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGroupBox, QLineEdit, QPushButton, QCheckBox, QLabel,
@@ -31,6 +41,269 @@ from PyQt5.QtWidgets import (
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
+# Number of linked pages fetched concurrently when following links
+FOLLOW_WORKERS = 12
+
+# Upper bound on linked pages followed per scan
+MAX_FOLLOW_LINKS = 50
+
+# Seconds a followed page's PDF links are reused across scans
+FOLLOW_CACHE_TTL = 600
+
+# Number of PDFs downloaded concurrently
+DOWNLOAD_WORKERS = 6
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Chromium flags that trim startup time and background work for headless scraping
+CHROMIUM_ARGS = [
+    '--disable-gpu',
+    '--disable-dev-shm-usage',
+    '--disable-background-networking',
+    '--disable-breakpad',
+    '--mute-audio',
+    '--blink-settings=imagesEnabled=false',
+]
+
+# Keywords that suggest script-related content
+SCRIPT_KEYWORDS = frozenset((
+    'script', 'screenplay', 'teleplay', 'pilot', 'episode',
+    'transcript', 'draft', 'shooting', 'final'
+))
+
+# URL pattern for script detail pages (like /script/movie-name)
+SCRIPT_PAGE_RE = re.compile(r'/(?:script|scripts|screenplay|screenplays)/[\w-]+')
+
+# Known script hosting CDNs and domains
+SCRIPT_PDF_DOMAINS = (
+    'assets.scriptslug.com',
+    'dailyscript.com',
+    'imsdb.com',
+    'screenplaydb.com',
+    'scriptpdf.com',
+)
+
+# Everything that marks a URL as a PDF, e.g.:
+#   .pdf extension          https://x.com/a.pdf, /a.pdf?v=123, /a.pdf#page=2,
+#                           /a.pdf;jsessionid=1
+#   pdf path segment        https://x.com/pdf/123, https://x.com/pdfs/abc
+#   script PDF domain       https://imsdb.com/scripts/alien?format=pdf
+#   ScriptSlug PDF route    https://scriptslug.com/live/pdf/123
+#   pdf download link       https://x.com/download?type=pdf, /pdf?action=download
+PDF_URL_RE = re.compile(
+    r'\.pdf(?:[?#;]|$)'
+    r'|/pdfs?/'
+    r'|scriptslug\.com/live/pdf'
+    r'|(?:' + '|'.join(re.escape(domain) for domain in SCRIPT_PDF_DOMAINS) + r').*pdf'
+    r'|download.*pdf|pdf.*download',
+    re.IGNORECASE
+)
+
+# Cap (seconds) on how long a server's Retry-After can delay a retry
+MAX_RETRY_AFTER = 5
+
+DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+# href prefixes that can never lead to a PDF
+NON_HTTP_PREFIXES = ('mailto:', 'tel:', 'javascript:', 'data:')
+
+# Resource types never needed to extract links from the rendered HTML
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet', 'websocket'})
+
+
+@functools.lru_cache(maxsize=8192)
+def _cached_urlparse(url):
+    """urlparse() memoized - the same URLs are parsed repeatedly during a scan."""
+    return urlparse(url)
+
+
+def _looks_like_pdf(url, href):
+    """Check if a URL points to a PDF file."""
+    return bool(PDF_URL_RE.search(url) or PDF_URL_RE.search(href))
+
+
+def _header_encoding(response):
+    """Return the charset declared in a response's Content-Type, or None.
+
+    Without one, lxml sniffs <meta charset> from the document bytes.
+    """
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    return None
+
+
+def _find_links(html, encoding=None):
+    """Return (href, lowercased link text) for every <a href> in an HTML document."""
+    if not html or not html.strip():
+        return []
+    parser = None
+    if encoding and isinstance(html, bytes):
+        try:
+            parser = lxml.html.HTMLParser(encoding=encoding)
+        except LookupError:
+            pass  # Charset lxml doesn't know - fall back to sniffing
+    try:
+        tree = lxml.html.fromstring(html, parser=parser)
+    except ValueError:
+        # lxml rejects str input that carries an XML encoding declaration
+        tree = lxml.html.fromstring(html.encode('utf-8'))
+    return [(link.get('href'), link.text_content().lower()) for link in tree.xpath('//a[@href]')]
+
+
+def _stream_links(response):
+    """Like _find_links, but parses a streamed response as its chunks arrive."""
+    try:
+        parser = etree.HTMLPullParser(events=('end',), recover=True, encoding=_header_encoding(response))
+    except LookupError:
+        # Charset lxml doesn't know - fall back to sniffing
+        parser = etree.HTMLPullParser(events=('end',), recover=True)
+    links = []
+
+    def collect():
+        for _, elem in parser.read_events():
+            if elem.tag == 'a':
+                href = elem.get('href')
+                if href:
+                    links.append((href, ''.join(elem.itertext()).lower()))
+                elem.clear()
+
+    for chunk in response.iter_content(chunk_size=16384):
+        parser.feed(chunk)
+        collect()
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass  # Empty document
+    collect()
+    return links
+
+
+def canonicalize_url(url):
+    """Normalize a URL into a deduplication key.
+
+    Lowercases the scheme and host, strips default ports and the fragment,
+    and sorts query params. Only use the result for comparison - it is not
+    guaranteed to request the same resource as the original URL.
+    """
+    parsed = _cached_urlparse(url)
+    scheme = parsed.scheme.lower()
+    netloc = parsed.netloc.lower()
+    default_port = DEFAULT_PORTS.get(scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[:-len(default_port)]
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    return urlunparse((scheme, netloc, parsed.path or '/', parsed.params, query, ''))
+
+
+def _site_host(url):
+    """Return the host of a canonical URL, ignoring a leading 'www.'."""
+    host = _cached_urlparse(url).netloc
+    return host[4:] if host.startswith('www.') else host
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After, but never waits longer than MAX_RETRY_AFTER."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+class _BrowserPool:
+    """Keeps a single headless Chromium alive across scans.
+
+    The sync Playwright API is bound to the thread that started it, so every
+    browser call is run on one dedicated thread and scan workers hand it jobs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._pw = None
+        self._browser = None
+
+    def fetch(self, url):
+        """Render a URL in a fresh browser context and return (final url, page HTML)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='playwright')
+            executor = self._executor
+        return executor.submit(self._render, url).result()
+
+    def close(self):
+        """Shut down the browser and the Playwright driver, if started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.submit(self._shutdown).result()
+            executor.shutdown()
+
+    def get_page(self):
+        """Open a page in a new browser context, launching Chromium on first use."""
+        self._ensure_browser()
+        context = self._browser.new_context(user_agent=USER_AGENT, java_script_enabled=True)
+        page = context.new_page()
+        page.route('**/*', self._route_request)
+        return page
+
+    def _ensure_browser(self):
+        """Start the Playwright driver and Chromium once, relaunching if the browser died."""
+        if self._pw is None:
+            self._pw = sync_playwright().start()
+        if self._browser is None or not self._browser.is_connected():
+            self._browser = self._pw.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+
+    def release(self, page):
+        """Close a page along with its browser context."""
+        page.context.close()
+
+    @staticmethod
+    def _route_request(route):
+        """Abort requests for resources that don't affect the page's links."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _render(self, url):
+        page = self.get_page()
+        try:
+            page.goto(url, wait_until='domcontentloaded', timeout=30000)
+            # Scroll down to trigger lazy loading
+            page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            # Wait until script links show up rather than sleeping a fixed time
+            try:
+                if 'scriptslug.com' in url:
+                    page.wait_for_selector('a[href*="/script/"]', state='attached', timeout=5000)
+                else:
+                    # Only real http(s) links count - javascript: anchors and the
+                    # site's "Scripts" nav link are there before content renders
+                    page.wait_for_function(
+                        "() => Array.from(document.querySelectorAll('a')).some(a =>"
+                        " a.protocol.startsWith('http') && /pdf|\\/scripts?\\/[\\w-]+/i.test(a.pathname + a.search))",
+                        timeout=5000,
+                    )
+            except PlaywrightTimeoutError:
+                pass
+            return page.url, page.content()
+        finally:
+            self.release(page)
+
+    def _shutdown(self):
+        if self._browser is not None:
+            if self._browser.is_connected():
+                self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+
+
+browser_pool = _BrowserPool()
+
 
 class ScanWorker(QThread):
     """Worker thread for scanning URLs."""
@@ -38,152 +311,136 @@ class ScanWorker(QThread):
     scan_complete = pyqtSignal(list)
     scan_error = pyqtSignal(str)
 
-    def __init__(self, session, url, filter_text, follow_links, render_js=False):
+    def __init__(self, session, url, filter_text, follow_links, render_js=False, follow_cache=None):
         super().__init__()
         self.session = session
         self.url = url
         self.filter_text = filter_text
         self.follow_links = follow_links
         self.render_js = render_js
+        # canonical url -> (fetch time, [(pdf_url, link_text), ...]), shared across scans
+        self.follow_cache = follow_cache if follow_cache is not None else {}
 
     def _fetch_with_playwright(self, url):
-        """Fetch page content using Playwright for JS rendering."""
+        """Fetch (final url, page content) using Playwright for JS rendering."""
         if not PLAYWRIGHT_AVAILABLE or sync_playwright is None:
             raise RuntimeError("Playwright is not installed")
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.set_extra_http_headers({
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
-            # Use 'load' instead of 'networkidle' - many sites never reach network idle due to ads/analytics
-            page.goto(url, wait_until='load', timeout=60000)
-            # Wait for content to render
-            page.wait_for_timeout(2000)
-            # Scroll down to trigger lazy loading
-            page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            page.wait_for_timeout(2000)  # Wait for lazy-loaded content
-            # Scroll back up and down to trigger more content
-            page.evaluate('window.scrollTo(0, 0)')
-            page.wait_for_timeout(500)
-            page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            page.wait_for_timeout(1500)
-            content = page.content()
-            browser.close()
-            return content
+        return browser_pool.fetch(url)
 
     def run(self):
+        # Bound cache memory to a single scan
+        _cached_urlparse.cache_clear()
         try:
-            found_pdfs = set()
+            # canonical url -> (filename, url)
+            found_pdfs = {}
 
             # Fetch the main page
             if self.render_js and PLAYWRIGHT_AVAILABLE:
                 self.log_message.emit("Using browser to render JavaScript...")
-                html_content = self._fetch_with_playwright(self.url)
-                soup = BeautifulSoup(html_content, 'lxml')
+                base_url, html_content = self._fetch_with_playwright(self.url)
+                all_links = _find_links(html_content)
             else:
-                response = self.session.get(self.url, timeout=30)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'lxml')
+                # Parse while downloading so large pages aren't read fully before parsing starts
+                with self.session.get(self.url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    base_url = response.url
+                    all_links = _stream_links(response)
 
-            # Find all links
-            all_links = soup.find_all('a', href=True)
             self.log_message.emit(f"Found {len(all_links)} links on page")
 
-            # Keywords that suggest script-related content
-            script_keywords = [
-                'script', 'screenplay', 'teleplay', 'pilot', 'episode',
-                'transcript', 'draft', 'shooting', 'final'
-            ]
-
-            # URL patterns that indicate script detail pages (like /script/movie-name)
-            script_page_patterns = [
-                r'/script/[\w-]+',
-                r'/scripts/[\w-]+',
-                r'/screenplay/[\w-]+',
-                r'/screenplays/[\w-]+',
-            ]
-
-            for link in all_links:
-                href = str(link.get('href', ''))
-                if not href:
+            # Classify links: direct PDF hits vs. pages worth following
+            to_follow = {}
+            # Resolve links against where the page ended up after redirects
+            base_host = _site_host(canonicalize_url(base_url))
+            for href, link_text in all_links:
+                if not href or href[0] == '#' or href.startswith(NON_HTTP_PREFIXES):
                     continue
-                full_url = urljoin(self.url, href)
-                link_text = link.get_text().lower()
+                full_url = urljoin(base_url, href)
 
                 # Check if it's a PDF link
-                if self._is_pdf_link(full_url, href):
+                if _looks_like_pdf(full_url, href):
                     if self._matches_filter(full_url, link_text):
-                        filename = self._extract_filename(full_url)
-                        found_pdfs.add((filename, full_url))
+                        pdf_url = urldefrag(full_url)[0]
+                        found_pdfs[canonicalize_url(pdf_url)] = (self._extract_filename(pdf_url), pdf_url)
 
                 # Follow links if enabled
-                elif self.follow_links:
+                elif self.follow_links and full_url[:5] in ('http:', 'https'):
                     combined = (link_text + ' ' + href.lower())
                     # Check if link matches script keywords or script page URL patterns
-                    is_script_link = any(kw in combined for kw in script_keywords)
-                    is_script_page = any(re.search(pattern, href) for pattern in script_page_patterns)
-                    
-                    if is_script_link or is_script_page:
+                    is_script_link = any(kw in combined for kw in SCRIPT_KEYWORDS)
+                    is_script_page = SCRIPT_PAGE_RE.search(href) is not None
+
+                    if not (is_script_link or is_script_page):
+                        continue
+
+                    # Stay on this site unless the link goes to a known script host
+                    page_url = canonicalize_url(full_url)
+                    sub_host = _site_host(page_url)
+                    if sub_host and sub_host != base_host and not any(d in sub_host for d in SCRIPT_PDF_DOMAINS):
+                        continue
+
+                    # Fetch each page once, however many anchors point at it
+                    if page_url not in to_follow and len(to_follow) < MAX_FOLLOW_LINKS:
+                        to_follow[page_url] = (full_url, link_text[:50] if link_text else href[:50])
+
+            # Reuse recently fetched pages, fetch the rest concurrently - the work is network-bound
+            now = time.monotonic()
+            for page_url in [u for u, (fetched, _) in self.follow_cache.items() if now - fetched >= FOLLOW_CACHE_TTL]:
+                del self.follow_cache[page_url]
+
+            to_fetch = []
+            for page_url, (full_url, label) in to_follow.items():
+                cached = self.follow_cache.get(page_url)
+                if cached:
+                    found_pdfs.update(self._filter_pdf_links(cached[1]))
+                else:
+                    to_fetch.append((page_url, full_url, label))
+
+            if to_fetch:
+                with ThreadPoolExecutor(max_workers=FOLLOW_WORKERS) as executor:
+                    futures = {}
+                    for page_url, full_url, label in to_fetch:
+                        self.log_message.emit(f"Following link: {label}...")
+                        futures[executor.submit(self._fetch_and_extract, full_url)] = page_url
+
+                    for future in as_completed(futures):
                         try:
-                            self.log_message.emit(f"Following link: {link_text[:50] if link_text else href[:50]}...")
-                            sub_response = self.session.get(full_url, timeout=15)
-                            sub_soup = BeautifulSoup(sub_response.text, 'lxml')
-
-                            for sub_link in sub_soup.find_all('a', href=True):
-                                sub_href = str(sub_link.get('href', ''))
-                                if not sub_href:
-                                    continue
-                                sub_full_url = urljoin(full_url, sub_href)
-                                sub_text = sub_link.get_text().lower()
-
-                                if self._is_pdf_link(sub_full_url, sub_href):
-                                    if self._matches_filter(sub_full_url, sub_text):
-                                        filename = self._extract_filename(sub_full_url)
-                                        found_pdfs.add((filename, sub_full_url))
+                            pdf_links = future.result()
                         except Exception as e:
                             self.log_message.emit(f"Could not follow link: {str(e)[:50]}")
+                            continue
+                        self.follow_cache[futures[future]] = (time.monotonic(), pdf_links)
+                        found_pdfs.update(self._filter_pdf_links(pdf_links))
 
-            self.scan_complete.emit(list(found_pdfs))
+            self.scan_complete.emit(list(found_pdfs.values()))
 
         except Exception as e:
             self.scan_error.emit(str(e))
 
-    def _is_pdf_link(self, url, href):
-        """Check if a URL points to a PDF file."""
-        url_lower = url.lower()
-        href_lower = href.lower()
-        parsed = urlparse(url_lower)
-        path = parsed.path
-
-        # Direct .pdf extension (handles query strings like file.pdf?v=123)
-        if path.endswith('.pdf'):
-            return True
-        if href_lower.endswith('.pdf') or '.pdf?' in href_lower or '.pdf#' in href_lower:
-            return True
-        
-        # Check for pdf in path segments
-        if '/pdf/' in path or '/pdfs/' in path:
-            return True
-        
-        # Known script hosting CDNs and domains
-        script_pdf_domains = [
-            'assets.scriptslug.com',
-            'scriptslug.com/live/pdf',
-            'dailyscript.com',
-            'imsdb.com',
-            'screenplaydb.com',
-            'scriptpdf.com',
-        ]
-        if any(domain in url_lower for domain in script_pdf_domains):
-            if 'pdf' in url_lower or path.endswith('.pdf'):
-                return True
-        
-        # Download links with pdf indication
-        if 'download' in url_lower and 'pdf' in url_lower:
-            return True
-        
-        return False
+    def _fetch_and_extract(self, url):
+        """Fetch a followed page and return the (url, link_text) PDF links on it."""
+        sub_response = self.session.get(url, timeout=15)
+        # Error pages must not be cached as "no PDFs"
+        sub_response.raise_for_status()
+
+        pdf_links = []
+        for sub_href, sub_text in _find_links(sub_response.content, _header_encoding(sub_response)):
+            if not sub_href or sub_href[0] == '#' or sub_href.startswith(NON_HTTP_PREFIXES):
+                continue
+            sub_full_url = urljoin(url, sub_href)
+
+            if _looks_like_pdf(sub_full_url, sub_href):
+                pdf_links.append((sub_full_url, sub_text))
+        return pdf_links
+
+    def _filter_pdf_links(self, pdf_links):
+        """Apply the user's filter to (url, link_text) pairs, returning {canonical url: (filename, url)}."""
+        pdfs = {}
+        for pdf_url, link_text in pdf_links:
+            if self._matches_filter(pdf_url, link_text):
+                pdf_url = urldefrag(pdf_url)[0]
+                pdfs[canonicalize_url(pdf_url)] = (self._extract_filename(pdf_url), pdf_url)
+        return pdfs
 
     def _matches_filter(self, url, link_text):
         """Check if the PDF matches the user's filter."""
@@ -194,7 +451,7 @@ class ScanWorker(QThread):
 
     def _extract_filename(self, url):
         """Extract a clean filename from a URL."""
-        parsed = urlparse(url)
+        parsed = _cached_urlparse(url)
         path = unquote(parsed.path)
         filename = os.path.basename(path)
         
@@ -234,36 +491,54 @@ class DownloadWorker(QThread):
         os.makedirs(self.download_dir, exist_ok=True)
         self.progress_update.emit(True)
 
-        success_count = 0
+        # Pick destination paths up front so concurrent downloads never
+        # race for the same filename
+        reserved = set()
+        jobs = []
         for row_index, filename, url in self.items:
-            try:
-                self.status_update.emit(row_index, "Downloading...")
-                self.log_message.emit(f"Downloading: {filename}")
+            filepath = os.path.join(self.download_dir, filename)
+            if os.path.exists(filepath) or filepath in reserved:
+                base, ext = os.path.splitext(filename)
+                counter = 1
+                while os.path.exists(filepath) or filepath in reserved:
+                    filepath = os.path.join(self.download_dir, f"{base}_{counter}{ext}")
+                    counter += 1
+            reserved.add(filepath)
+            jobs.append((row_index, filename, url, filepath))
 
-                response = self.session.get(url, timeout=60, stream=True)
-                response.raise_for_status()
+        success_count = 0
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+            futures = [executor.submit(self._download_one, *job) for job in jobs]
+            for future in as_completed(futures):
+                success_count += future.result()
 
-                filepath = os.path.join(self.download_dir, filename)
-                if os.path.exists(filepath):
-                    base, ext = os.path.splitext(filename)
-                    counter = 1
-                    while os.path.exists(filepath):
-                        filepath = os.path.join(self.download_dir, f"{base}_{counter}{ext}")
-                        counter += 1
+        self.progress_update.emit(False)
+        self.download_complete.emit(success_count, len(self.items))
 
-                with open(filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+    def _download_one(self, row_index, filename, url, filepath):
+        """Download a single PDF to filepath. Returns 1 on success, 0 on failure."""
+        try:
+            self.status_update.emit(row_index, "Downloading...")
+            self.log_message.emit(f"Downloading: {filename}")
 
-                self.status_update.emit(row_index, "Downloaded")
-                success_count += 1
+            # PDFs are already compressed - ask for the raw bytes
+            response = self.session.get(
+                url, timeout=60, stream=True, headers={'Accept-Encoding': 'identity'}
+            )
+            response.raise_for_status()
 
-            except Exception as e:
-                self.log_message.emit(f"Failed to download {filename}: {str(e)}")
-                self.status_update.emit(row_index, "Failed")
+            # Copy the raw stream in large blocks; decode_content undoes any gzip transfer encoding
+            response.raw.decode_content = True
+            with open(filepath, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
 
-        self.progress_update.emit(False)
-        self.download_complete.emit(success_count, len(self.items))
+            self.status_update.emit(row_index, "Downloaded")
+            return 1
+
+        except Exception as e:
+            self.log_message.emit(f"Failed to download {filename}: {str(e)}")
+            self.status_update.emit(row_index, "Failed")
+            return 0
 
 
 class ScriptFinder(QMainWindow):
@@ -283,15 +558,40 @@ class ScriptFinder(QMainWindow):
         self.is_scanning = False
         self.scan_worker = None
         self.download_worker = None
+        # PDF links found on followed pages, reused by later scans
+        self.follow_cache = {}
 
         # Session for requests
         self.session = requests.Session()
+        # requests already advertises gzip (and br when brotli is installed)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/pdf;q=0.9,*/*;q=0.8',
         })
+        # Larger connection pool for concurrent scan/download workers, with
+        # retries on transient server errors
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=_CappedRetry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(['GET', 'HEAD']),
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
         self._create_ui()
 
+        # Log messages are buffered and appended in batches to limit repaints
+        self._log_buffer = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start()
+
     def _create_ui(self):
         """Create the user interface."""
         central_widget = QWidget()
@@ -376,7 +676,8 @@ class ScriptFinder(QMainWindow):
         self.results_tree.setAlternatingRowColors(True)
         header = self.results_tree.header()
         if header:
-            header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+            # Sized once per scan in _scan_complete; ResizeToContents would recompute on every insert
+            header.setSectionResizeMode(0, QHeaderView.Interactive)
             header.setSectionResizeMode(1, QHeaderView.Stretch)
             header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         results_layout.addWidget(self.results_tree)
@@ -420,7 +721,13 @@ class ScriptFinder(QMainWindow):
 
     def _log(self, message):
         """Add a message to the log."""
-        self.log_text.append(message)
+        self._log_buffer.append(message)
+
+    def _flush_log(self):
+        """Append buffered log messages to the log view."""
+        if self._log_buffer:
+            self.log_text.append('\n'.join(self._log_buffer))
+            self._log_buffer.clear()
 
     def _browse_directory(self):
         """Open directory browser dialog."""
@@ -463,7 +770,9 @@ class ScriptFinder(QMainWindow):
         follow_links = self.follow_links_check.isChecked()
         render_js = self.render_js_check.isChecked() and PLAYWRIGHT_AVAILABLE
 
-        self.scan_worker = ScanWorker(self.session, url, filter_text, follow_links, render_js)
+        self.scan_worker = ScanWorker(
+            self.session, url, filter_text, follow_links, render_js, self.follow_cache
+        )
         self.scan_worker.log_message.connect(self._log)
         self.scan_worker.scan_complete.connect(self._scan_complete)
         self.scan_worker.scan_error.connect(self._scan_error)
@@ -478,9 +787,13 @@ class ScriptFinder(QMainWindow):
         self.found_pdfs = pdfs
 
         if pdfs:
-            for filename, url in pdfs:
-                item = QTreeWidgetItem([filename, url, "Ready"])
-                self.results_tree.addTopLevelItem(item)
+            items = [QTreeWidgetItem([filename, url, "Ready"]) for filename, url in pdfs]
+            self.results_tree.setUpdatesEnabled(False)
+            self.results_tree.blockSignals(True)
+            self.results_tree.addTopLevelItems(items)
+            self.results_tree.blockSignals(False)
+            self.results_tree.setUpdatesEnabled(True)
+            self.results_tree.resizeColumnToContents(0)
 
             self.download_selected_btn.setEnabled(True)
             self.download_all_btn.setEnabled(True)
@@ -754,7 +1067,9 @@ def main():
     
     window = ScriptFinder()
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    browser_pool.close()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":